@@ -15,6 +15,7 @@ Requirements (Debian/Ubuntu example):
   sudo apt install python3-gi gir1.2-gtk-4.0 gir1.2-gst-plugins-base-1.0 gir1.2-gstreamer-1.0 \
                    gstreamer1.0-plugins-good gstreamer1.0-plugins-bad gstreamer1.0-libav \
                    python3-gi-cairo gir1.2-gdkpixbuf-2.0
+  pip install requests "httpx[http2]" orjson   # orjson is optional
 
 Run:
   python3 listenhearthisat.py
@@ -22,10 +23,22 @@ Run:
 
 import sys
 import json
+import hashlib
+import asyncio
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson  # Optional, much faster JSON (de)serialization
+except ImportError:
+    orjson = None
 
 import gi
 gi.require_version("Gtk", "4.0")
@@ -35,50 +48,290 @@ from gi.repository import Gtk, Gio, GLib, Gdk, Gst, GObject, GdkPixbuf
 
 Gst.init(None)
 
+# Tags the now-playing panel uses; everything else in a taglist is skipped
+_WANTED_TAGS = frozenset((
+    Gst.TAG_TITLE, Gst.TAG_ARTIST, Gst.TAG_GENRE, Gst.TAG_IMAGE, Gst.TAG_PREVIEW_IMAGE,
+))
+
 API_BASE = "https://api-v2.hearthis.at"
+API_TIMEOUT = (3, 10)    # (connect, read) seconds per request
+MAX_COVER_BYTES = 2_000_000  # Covers larger than this are not downloaded
+COVER_CACHE_BYTES = 64_000_000  # On-disk cover cache is pruned (oldest first) above this
+COVER_PRUNE_EVERY = 32  # Cover writes between size checks of the cache directory
+ARTIST_INFO_TTL = 3600  # Seconds before cached artist info is fetched again
+TEX_CACHE_SIZE = 16     # Embedded cover textures kept for recently played streams
+
+# Shared styling for track rows, installed once per display instead of per-row setters
+TRACK_ROW_CSS = """
+.track-row { margin: 6px; }
+"""
 
 # ------------- Helper cache -------------
+def json_loads(b):
+    if orjson is not None:
+        return orjson.loads(b)
+    return json.loads(b)
+
+def json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
 class Cache:
-    def __init__(self, cache_dir=".cache"):
+    def __init__(self, cache_dir=".cache", mem_size=64):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
+        # Hot entries stay parsed in memory (LRU) in front of the JSON files
+        self.mem_size = mem_size
+        self._mem = OrderedDict()
+        self._lock = threading.Lock()
 
     def _path(self, key: str) -> Path:
-        safe = key.replace("/", "_").replace(" ", "_")
-        return self.cache_dir / f"{safe}.json"
-
-    def get(self, key: str):
+        # Fixed-length, collision-safe name for arbitrary keys (search queries etc.)
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _remember(self, key: str, ts, data):
+        with self._lock:
+            self._mem[key] = (ts, data)
+            self._mem.move_to_end(key)
+            while len(self._mem) > self.mem_size:
+                self._mem.popitem(last=False)
+
+    def _load(self, key: str):
+        with self._lock:
+            if key in self._mem:
+                self._mem.move_to_end(key)
+                return self._mem[key]
         p = self._path(key)
         if p.exists():
             try:
-                with p.open("r", encoding="utf-8") as f:
-                    return json.load(f)
+                with p.open("rb") as f:
+                    entry = json_loads(f.read())
+                if entry.get("_key") != key:
+                    return None
+                ts, data = entry.get("_ts", 0), entry["data"]
             except Exception:
                 return None
+            self._remember(key, ts, data)
+            return ts, data
         return None
 
+    def get(self, key: str, max_age=None):
+        """Cached data for `key`, or None if missing or older than `max_age` seconds."""
+        hit = self._load(key)
+        if hit is None:
+            return None
+        ts, data = hit
+        if max_age is not None and time.time() - ts > max_age:
+            return None
+        return data
+
+    def peek(self, key: str):
+        """In-memory data for `key`, or None; never touches the disk, so safe on the UI thread."""
+        with self._lock:
+            hit = self._mem.get(key)
+            if hit is None:
+                return None
+            self._mem.move_to_end(key)
+        return hit[1]
+
     def set(self, key: str, data):
+        ts = time.time()
+        self._remember(key, ts, data)
         p = self._path(key)
         try:
-            with p.open("w", encoding="utf-8") as f:
-                json.dump(data, f)
+            with p.open("wb") as f:
+                f.write(json_dumps({"_key": key, "_ts": ts, "data": data}))
         except Exception:
             pass
 
 # ---------- Image utilities ----------
-def fetch_image_bytes(url: str, timeout=15):
-    try:
-        r = requests.get(url, timeout=timeout)
-        r.raise_for_status()
-        return r.content
-    except Exception:
+# Bounded pool for all cover decoding (CPU-bound, so a few workers are enough)
+IMG_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="img")
+
+class AsyncFetcher:
+    """Single background asyncio loop that downloads images over one pooled httpx client.
+
+    Concurrent submissions for the same URL share one download, and downloaded
+    images are kept on disk so covers survive restarts. Images are decoded on
+    IMG_POOL; callbacks receive the texture (or None on failure) on the GTK
+    main loop.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_concurrency=8, cache_dir=".cache/covers"):
+        self.max_concurrency = max_concurrency
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.loop = None
+        self._pending = {}  # url -> asyncio.Task, touched only on the loop thread
+        self._writes = 0    # Covers written this session, loop thread only
+        self._ready = threading.Event()
+        self._error = None  # Set if the loop thread failed to start
+        self._thread = threading.Thread(
+            target=lambda: asyncio.run(self._main()), name="async-fetcher", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    @classmethod
+    def instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @staticmethod
+    def _make_client(http2: bool):
+        return httpx.AsyncClient(
+            http2=http2,
+            timeout=httpx.Timeout(API_TIMEOUT[1], connect=API_TIMEOUT[0]),
+            follow_redirects=True,
+            headers={"User-Agent": "HearThisGTK4"},
+            limits=httpx.Limits(max_keepalive_connections=16),
+        )
+
+    async def _main(self):
+        try:
+            self.loop = asyncio.get_running_loop()
+            self._sem = asyncio.Semaphore(self.max_concurrency)
+            try:
+                self._client = self._make_client(http2=True)
+            except ImportError:
+                # httpx[http2] extra (h2) not installed - pooled HTTP/1.1 still works
+                self._client = self._make_client(http2=False)
+        except Exception as e:
+            self._error = e
+            return
+        finally:
+            # Never leave __init__ waiting, whether or not the client came up
+            self._ready.set()
+        async with self._client:
+            await asyncio.Event().wait()  # Serve submissions until the process exits
+
+    def _path(self, url: str) -> Path:
+        return self.cache_dir / hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _read_cached(self, url: str):
+        try:
+            return self._path(url).read_bytes()
+        except OSError:
+            return None
+
+    def _write_cached(self, url: str, data: bytes):
+        p = self._path(url)
+        tmp = p.with_suffix(".part")
+        try:
+            tmp.write_bytes(data)
+            tmp.replace(p)
+        except OSError:
+            pass
+
+    def _prune_cache(self):
+        # Drop the oldest covers (by mtime) until the directory fits COVER_CACHE_BYTES
+        entries = []
+        try:
+            for f in self.cache_dir.iterdir():
+                try:
+                    st = f.stat()
+                except OSError:
+                    continue  # Renamed/removed by a concurrent write
+                entries.append((st.st_mtime, st.st_size, f))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, f in sorted(entries, key=lambda e: e[0]):
+            if total <= COVER_CACHE_BYTES:
+                break
+            try:
+                f.unlink()
+                total -= size
+            except OSError:
+                pass
+
+    async def _get(self, url: str):
+        data = await asyncio.to_thread(self._read_cached, url)
+        if data:
+            return data
+        async with self._sem:
+            try:
+                async with self._client.stream("GET", url) as r:
+                    r.raise_for_status()
+                    chunks, size = [], 0
+                    async for chunk in r.aiter_bytes():
+                        size += len(chunk)
+                        if size > MAX_COVER_BYTES:
+                            return None
+                        chunks.append(chunk)
+                data = b"".join(chunks)
+            except Exception:
+                return None
+        if not sniff_image_type(data):
+            return None  # Error page or other non-image body - neither cache nor decode it
+        await asyncio.to_thread(self._write_cached, url, data)
+        if self._writes % COVER_PRUNE_EVERY == 0:
+            await asyncio.to_thread(self._prune_cache)  # First write of a session, then periodically
+        self._writes += 1
+        return data
+
+    def _attach(self, url: str, size, callback, handle: Future):
+        task = self._pending.get(url)
+        if task is None:
+            task = self.loop.create_task(self._get(url))
+            self._pending[url] = task
+            task.add_done_callback(lambda _t: self._pending.pop(url, None))
+        task.add_done_callback(
+            lambda t: IMG_POOL.submit(self._decode, t.result(), size, callback, handle)
+        )
+
+    @staticmethod
+    def _decode(data, size, callback, handle: Future):
+        if not handle.set_running_or_notify_cancel():
+            return  # Requester went away before the image arrived
+        tex = decode_cover_bytes(data, size)
+        handle.set_result(tex)
+        GLib.idle_add(callback, tex)
+
+    def submit(self, url: str, callback, size=None) -> Future:
+        """Queue a cover; the returned Future can be cancel()ed until decoding starts."""
+        handle = Future()
+        self.loop.call_soon_threadsafe(self._attach, url, size, callback, handle)
+        return handle
+
+def sniff_image_type(b: bytes):
+    if b[:3] == b"\xff\xd8\xff":
+        return "jpeg"
+    if b[:8] == b"\x89PNG\r\n\x1a\n":
+        return "png"
+    return None
+
+def decode_cover_bytes(b: bytes, size=None):
+    """Decode JPEG/PNG cover art only (no SVG & co. loaders); for worker threads, not the main loop."""
+    image_type = sniff_image_type(b) if b else None
+    if not image_type:
         return None
+    return texture_from_bytes(b, size, image_type)
 
-def texture_from_bytes(b: bytes):
+def texture_from_bytes(b: bytes, target=None, image_type=None):
+    """Decode image bytes into a texture; with `target`, decode at roughly target x target px."""
     if not b:
         return None
     try:
-        loader = GdkPixbuf.PixbufLoader.new()
+        if image_type:
+            loader = GdkPixbuf.PixbufLoader.new_with_type(image_type)
+        else:
+            loader = GdkPixbuf.PixbufLoader.new()
+        if target:
+            def on_size_prepared(ldr, w, h):
+                # Downscale only, keeping aspect so ContentFit.COVER still crops correctly
+                scale = target / min(w, h)
+                if scale < 1:
+                    ldr.set_size(max(1, round(w * scale)), max(1, round(h * scale)))
+            loader.connect("size-prepared", on_size_prepared)
         loader.write(b)
         loader.close()
         pixbuf = loader.get_pixbuf()
@@ -110,61 +363,90 @@ def get_placeholder_texture():
     return None
 
 # ---------- Track row with cover ----------
-class TrackRow(Gtk.ListBoxRow):
-    __gtype_name__ = "TrackRow"
+def valid_tracks(data):
+    """Track dicts from an API page reply (drops error objects and junk entries)."""
+    if not isinstance(data, list):
+        return []
+    return [t for t in data if isinstance(t, dict)]
+
+def track_art_url(track: dict):
+    # Cover from API (fallback - ID3 during playback)
+    art_url = (
+        track.get("artwork_url") or
+        track.get("thumb") or
+        track.get("images", {}).get("thumbnail") or
+        track.get("background") or
+        track.get("waveform")
+    )
+    if art_url and art_url.startswith("http"):
+        return art_url
+    return None
+
+class TrackItem(GObject.Object):
+    """List model item wrapping one API track dict."""
+    __gtype_name__ = "TrackItem"
 
     def __init__(self, track: dict):
         super().__init__()
         self.track = track
-        self.set_selectable(True)
+        self.cover = None  # Thumbnail texture, kept once loaded so re-binding is free
 
-        title = track.get("title") or "Unknown"
-        user = track.get("user", {}).get("username") or ""
-        genre = track.get("genre") or ""
+class TrackView(Gtk.Box):
+    """Cover + title/subtitle widgets; recycled by the list factory across items."""
+    __gtype_name__ = "TrackView"
+
+    def __init__(self):
+        super().__init__(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        self.item = None
+        self._cover_future = None
+        self.add_css_class("track-row")
 
         # Cover (thumbnail)
         self.picture = Gtk.Picture(content_fit=Gtk.ContentFit.COVER)
         self.picture.set_size_request(56, 56)
 
         # Text
-        title_lbl = Gtk.Label(label=title, xalign=0)
-        title_lbl.add_css_class("title-3")
-
-        subtitle_text = user if user else genre
-        subtitle_lbl = Gtk.Label(label=subtitle_text, xalign=0)
-        subtitle_lbl.add_css_class("dim-label")
+        self.title_lbl = Gtk.Label(xalign=0)
+        self.title_lbl.add_css_class("title-3")
+        self.subtitle_lbl = Gtk.Label(xalign=0)
+        self.subtitle_lbl.add_css_class("dim-label")
 
         vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
-        vbox.append(title_lbl)
-        vbox.append(subtitle_lbl)
-
-        hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        hbox.set_margin_top(6)
-        hbox.set_margin_bottom(6)
-        hbox.set_margin_start(6)
-        hbox.set_margin_end(6)
-        hbox.append(self.picture)
-        hbox.append(vbox)
-        self.set_child(hbox)
-
-        # Load cover from API (fallback - ID3 during playback)
-        art_url = (
-            track.get("artwork_url") or
-            track.get("thumb") or
-            track.get("images", {}).get("thumbnail") or
-            track.get("background") or
-            track.get("waveform")
-        )
-        if art_url and art_url.startswith("http"):
-            threading.Thread(target=self._load_cover, args=(art_url,), daemon=True).start()
-        else:
-            print(f"No valid artwork URL for track: {title}")
+        vbox.append(self.title_lbl)
+        vbox.append(self.subtitle_lbl)
 
-    def _load_cover(self, url):
-        b = fetch_image_bytes(url)
-        tex = texture_from_bytes(b)
+        self.append(self.picture)
+        self.append(vbox)
+
+    def bind(self, item: TrackItem):
+        self.item = item
+        track = item.track
+        user = track.get("user", {}).get("username") or ""
+        genre = track.get("genre") or ""
+        self.title_lbl.set_label(track.get("title") or "Unknown")
+        self.subtitle_lbl.set_label(user if user else genre)
+        self.picture.set_paintable(item.cover)
+        if item.cover is None:
+            art_url = track_art_url(track)
+            if art_url:
+                self._cover_future = AsyncFetcher.instance().submit(
+                    art_url, lambda tex: self._set_cover(item, tex), size=56
+                )
+
+    def unbind(self):
+        self.item = None
+        if self._cover_future:
+            # Scrolled away before the cover arrived - don't decode it for nobody
+            self._cover_future.cancel()
+            self._cover_future = None
+
+    def _set_cover(self, item, tex):
         if tex:
-            GLib.idle_add(self.picture.set_paintable, tex)
+            item.cover = tex
+            # The view may have been recycled for another track meanwhile
+            if self.item is item:
+                self.picture.set_paintable(tex)
+        return False
 
 # ---------- GStreamer adapter ----------
 class GstPlayer(GObject.GObject):
@@ -173,6 +455,11 @@ class GstPlayer(GObject.GObject):
     def __init__(self):
         super().__init__()
         self.playbin = Gst.ElementFactory.make("playbin", "player")
+        # Network queue limits (queue2 defaults: 2 s / 2 MiB): a bit more read-ahead against
+        # stalls. Start-up isn't gated on these - BUFFERING messages are not acted on, so
+        # playback begins as soon as the pipeline has prerolled.
+        self.playbin.set_property("buffer-duration", 3 * Gst.SECOND)
+        self.playbin.set_property("buffer-size", 2 * 1024 * 1024)
         # Signals from bus (EOS, TAG, etc.)
         self.bus = self.playbin.get_bus()
         self.bus.add_signal_watch()
@@ -183,6 +470,7 @@ class GstPlayer(GObject.GObject):
         # External callbacks
         self.on_eos = None
         self.on_tags = None
+        self.on_stream_start = None
         self.on_about_to_finish = None
 
         # Current queue for auto-play
@@ -191,6 +479,9 @@ class GstPlayer(GObject.GObject):
     def set_uri(self, uri: str):
         self.playbin.set_property("uri", uri)
 
+    def has_uri(self) -> bool:
+        return bool(self.playbin.get_property("uri"))
+
     def play(self):
         self.playbin.set_state(Gst.State.PLAYING)
 
@@ -232,7 +523,7 @@ class GstPlayer(GObject.GObject):
         sec = max(0, sec)
         self.playbin.seek_simple(
             Gst.Format.TIME,
-            Gst.SeekFlags.FLUSH | Gst.SeekFlags.KEY_UNIT,
+            Gst.SeekFlags.FLUSH | Gst.SeekFlags.KEY_UNIT | Gst.SeekFlags.ACCURATE,
             sec * Gst.SECOND,
         )
 
@@ -249,6 +540,9 @@ class GstPlayer(GObject.GObject):
             taglist = message.parse_tag()
             if self.on_tags:
                 self.on_tags(taglist)
+        elif t == Gst.MessageType.STREAM_START:
+            if self.on_stream_start:
+                self.on_stream_start()
 
     def _on_about_to_finish(self, playbin):
         if self.on_about_to_finish and callable(self.on_about_to_finish):
@@ -260,10 +554,18 @@ class GstPlayer(GObject.GObject):
 
 # ---------- Main window ----------
 class HearThisApp(Gtk.Application):
+    # Tag names resolved once instead of through the Gst module proxy on every tag message
+    _T_TITLE = Gst.TAG_TITLE
+    _T_ARTIST = Gst.TAG_ARTIST
+    _T_GENRE = Gst.TAG_GENRE
+    _T_IMAGE = Gst.TAG_IMAGE
+    _T_PREVIEW = Gst.TAG_PREVIEW_IMAGE
+
     def __init__(self):
         super().__init__(application_id="org.example.HearThisGTK4",
                          flags=Gio.ApplicationFlags.FLAGS_NONE)
         self.connect("activate", self.on_activate)
+        self.connect("shutdown", self.on_shutdown)
 
         # State
         self.current_mode = ''
@@ -271,24 +573,60 @@ class HearThisApp(Gtk.Application):
         self.current_type = None
         self.current_page = 1
         self.tracks_per_page = 20
+        self._inflight = {}  # cache key -> threading.Event for page fetches in progress
+        self._inflight_lock = threading.Lock()
+        self._genre_model = None
+        self._last_artist_info = (None, None)  # (username, info) last shown in the sidebar
+        self._cur_desc = None
+        self._cur_avatar_url = None  # None while the placeholder is shown
+        self._genres_hash = None
         self.is_seeking = False  # Track user interaction with seek bar
+        self._tick_id = 0        # Position timer, only armed while playing
+        self._seek_src = 0       # Pending debounced seek
+        self._pending_seek = 0
+        self._last_dur = None
 
         self.cache = Cache()
         self.player = GstPlayer()
 
+        # One keep-alive session for all API traffic
+        self.http = requests.Session()
+        self.http.headers.update({"User-Agent": "HearThisGTK4"})
+        self.http.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+
         # Lists and auto-next
-        self.local_tracks = []    # All
-        self.selected_tracks = [] # Selected
+        self.all_store = Gio.ListStore.new(TrackItem)       # All
+        self.selected_store = Gio.ListStore.new(TrackItem)  # Selected
         self.current_playlist = "all"   # "all" | "selected"
+        self._active_list = self.all_store  # Store behind current_playlist
         self.current_index = -1
+        # (index, track dict) to chain after the current one; resolved on the main loop,
+        # only read by about-to-finish, which must not touch the (non thread-safe) stores
+        self._next_track = None
+        self.all_store.connect("items-changed", self._on_store_changed)
+        self.selected_store.connect("items-changed", self._on_store_changed)
 
         # Cover from tags (last)
         self.last_stream_texture = None
+        self._last_title_text = ""  # Text currently in now_title / now_meta
+        self._last_meta_text = ""
+        self._pending_now_update = None  # (title, artist, genre, texture) awaiting _flush_now_update
+        self._now_update_scheduled = False
+        self._now_update_lock = threading.Lock()
+        self._last_cover_hash = None  # hash() of the last decoded embedded cover
+        # Decoded embedded covers by stream URI (LRU), so replays skip the decode
+        self._tex_cache = OrderedDict()
+        self._tex_cache_lock = threading.Lock()
+        # Serial, so embedded covers are applied in arrival order
+        self._decode_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cover-decode")
+        self._placeholder_tex = None  # Avatar placeholder, resolved once the display exists
 
         # Assign GStreamer callbacks
         self.player.on_eos = self._on_eos
         self.player.on_tags = self._on_gst_tags
         self.player.on_about_to_finish = self._on_about_to_finish
+        self.player.on_stream_start = self._on_stream_start
+        self._about_to_finish_fired = False  # Next URI queued gaplessly, not started yet
 
     def on_activate(self, app):
         # Main window
@@ -296,6 +634,19 @@ class HearThisApp(Gtk.Application):
         self.win.set_title("HearThis (GTK4)")
         self.win.set_default_size(1100, 720)
         self.win.set_resizable(True)
+        self._placeholder_tex = get_placeholder_texture()  # Icon theme lookup once, not per artist
+
+        css = Gtk.CssProvider()
+        if hasattr(css, "load_from_string"):  # GTK >= 4.12
+            css.load_from_string(TRACK_ROW_CSS)
+        else:
+            try:
+                css.load_from_data(TRACK_ROW_CSS, -1)  # GTK 4.10
+            except TypeError:  # GTK 4.6/4.8 bindings take a single bytes argument
+                css.load_from_data(TRACK_ROW_CSS.encode("utf-8"))
+        Gtk.StyleContext.add_provider_for_display(
+            self.win.get_display(), css, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+        )
 
         # Headerbar
         header = Gtk.HeaderBar()
@@ -364,9 +715,14 @@ class HearThisApp(Gtk.Application):
         scroll_all.set_hexpand(True)
         scroll_all.set_vexpand(True)
 
-        self.list_all = Gtk.ListBox()
+        # Virtualized list: only rows in view get widgets, recycled on scroll
+        self.all_selection = Gtk.SingleSelection.new(self.all_store)
+        self.all_selection.set_autoselect(False)
+        self.all_selection.set_can_unselect(True)
+
+        self.list_all = Gtk.ListView.new(self.all_selection, self._track_factory("all"))
         self.list_all.add_css_class("boxed-list")
-        self.list_all.connect("row-activated", self.on_row_activated)
+        self.list_all.connect("activate", self.on_row_activated)
         scroll_all.set_child(self.list_all)
 
         # ScrolledWindow for "Selected Tracks"
@@ -375,9 +731,13 @@ class HearThisApp(Gtk.Application):
         scroll_selected.set_hexpand(True)
         scroll_selected.set_vexpand(True)
 
-        self.list_selected = Gtk.ListBox()
+        selected_selection = Gtk.SingleSelection.new(self.selected_store)
+        selected_selection.set_autoselect(False)
+        selected_selection.set_can_unselect(True)
+
+        self.list_selected = Gtk.ListView.new(selected_selection, self._track_factory("selected"))
         self.list_selected.add_css_class("boxed-list")
-        self.list_selected.connect("row-activated", self.on_row_activated_selected)
+        self.list_selected.connect("activate", self.on_row_activated_selected)
         scroll_selected.set_child(self.list_selected)
 
         self.notebook.append_page(scroll_all, Gtk.Label(label="All Tracks"))
@@ -405,7 +765,7 @@ class HearThisApp(Gtk.Application):
         info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
         self.artist_avatar = Gtk.Picture(content_fit=Gtk.ContentFit.COVER)
         self.artist_avatar.set_size_request(120, 120)
-        self.artist_avatar.set_paintable(get_placeholder_texture())  # Set placeholder
+        self.artist_avatar.set_paintable(self._placeholder_tex)
         self.artist_desc = Gtk.Label(xalign=0)
         self.artist_desc.set_wrap(True)
         self.artist_desc.set_wrap_mode(Gtk.WrapMode.WORD)
@@ -511,9 +871,11 @@ class HearThisApp(Gtk.Application):
 
         # Initial data
         self.load_genres()
-        GLib.timeout_add(100, self.update_position)
         self.player.set_volume(1.0)
 
+    def on_shutdown(self, app):
+        self._decode_pool.shutdown(wait=False, cancel_futures=True)
+
     # -------- Seek bar interaction --------
     def _on_seek_start(self, gesture, n_press, x, y):
         self.is_seeking = True
@@ -528,11 +890,28 @@ class HearThisApp(Gtk.Application):
         threading.Thread(target=fn, args=a, kwargs=kw, daemon=True).start()
 
     def fetch_artist_info(self, username):
-        try:
-            info = requests.get(f"{API_BASE}/{username}/", timeout=15).json()
-        except Exception as e:
+        last_username, last_info = self._last_artist_info
+        if username == last_username:
+            GLib.idle_add(self.update_artist_info, last_info)
+            return
+        key = f"artist_info_{username}"
+        info = self.cache.get(key, max_age=ARTIST_INFO_TTL)
+        if not isinstance(info, dict) or not info:  # Missing, expired or an empty entry
             info = {}
-            print("Artist info error:", e)
+            try:
+                resp = self.http.get(f"{API_BASE}/{username}/", timeout=API_TIMEOUT, stream=False)
+                if resp.ok:
+                    data = json_loads(resp.content)
+                    if isinstance(data, dict) and data:
+                        info = data
+                        self.cache.set(key, info)
+                else:
+                    print("Artist info error: HTTP", resp.status_code)
+            except Exception as e:
+                print("Artist info error:", e)
+        if info:
+            # Only real profiles are cached/remembered, so a transient error is retried next time
+            self._last_artist_info = (username, info)
         GLib.idle_add(self.update_artist_info, info)
 
     def on_search_artist(self, *_):
@@ -574,7 +953,7 @@ class HearThisApp(Gtk.Application):
     def load_genres(self):
         def worker():
             try:
-                data = requests.get(f"{API_BASE}/categories/", timeout=15).json()
+                data = json_loads(self.http.get(f"{API_BASE}/categories/", timeout=API_TIMEOUT, stream=False).content)
                 genres = [g["id"] for g in data]
             except Exception as e:
                 print("Genres error:", e)
@@ -583,8 +962,15 @@ class HearThisApp(Gtk.Application):
         self._threaded(worker)
 
     def _set_genres(self, genres):
-        model = Gtk.StringList.new(genres)
-        self.genre_dropdown.set_model(model)
+        h = hash(tuple(genres))
+        if h == self._genres_hash:
+            return  # Unchanged - keep model and selection as they are
+        self._genres_hash = h
+        if self._genre_model is None:
+            self._genre_model = Gtk.StringList.new(genres)
+            self.genre_dropdown.set_model(self._genre_model)
+        else:
+            self._genre_model.splice(0, self._genre_model.get_n_items(), genres)
         if genres:
             self.genre_dropdown.set_selected(0)
             self.selected_genre = genres[0]
@@ -604,15 +990,25 @@ class HearThisApp(Gtk.Application):
 
     def on_prev_page(self, *_):
         if self.current_mode and self.current_page > 1:
-            self.current_page -= 1
-            self._clear_all_tracks()
-            self._threaded(self._fetch_page, self.current_mode, self.current_param, self.current_page, self.current_type)
+            self._goto_page(self.current_page - 1)
 
     def on_next_page(self, *_):
         if self.current_mode:
-            self.current_page += 1
-            self._clear_all_tracks()
-            self._threaded(self._fetch_page, self.current_mode, self.current_param, self.current_page, self.current_type)
+            self._goto_page(self.current_page + 1)
+
+    def _goto_page(self, page):
+        self.current_page = page
+        mode, param, type_ = self.current_mode, self.current_param, self.current_type
+        req = self._page_request(mode, param, page, type_)
+        cached = self.cache.peek(req[2]) if req else None
+        if cached:
+            # Already prefetched into memory - render without a worker round-trip
+            self.fill_track_list(valid_tracks(cached), True)
+            self.page_label.set_text(f"Page: {page}")
+            self._threaded(self._prefetch_page, mode, param, page + 1, type_, cached)
+            return
+        self._clear_all_tracks()
+        self._threaded(self._fetch_page, mode, param, page, type_)
 
     def on_load_more(self, *_):
         if self.current_mode:
@@ -620,7 +1016,7 @@ class HearThisApp(Gtk.Application):
             self._threaded(self._fetch_page, self.current_mode, self.current_param, self.current_page, self.current_type, True)
             GLib.idle_add(self.page_label.set_text, f"Page: {self.current_page}")
 
-    def _fetch_page(self, mode, param, page, type_=None, append=False):
+    def _page_request(self, mode, param, page, type_=None):
         if mode == 'genre':
             url = f"{API_BASE}/categories/{param}/"
             params = {"page": page, "count": self.tracks_per_page}
@@ -634,122 +1030,184 @@ class HearThisApp(Gtk.Application):
             params = {"t": param, "page": page, "count": self.tracks_per_page}
             key = f"{mode}_{param.replace(' ','_')}_page{page}"
         else:
-            return
+            return None
+        return url, params, key
 
+    def _load_page(self, mode, url, params, key, wait=True):
+        """Return page data from cache or API; a key already being fetched is not requested twice."""
         cached = self.cache.get(key)
         if cached:
-            GLib.idle_add(self.fill_track_list, cached, not append, append)
-            GLib.idle_add(self.page_label.set_text, f"Page: {page}")
-            return
+            return cached
+        with self._inflight_lock:
+            done = self._inflight.get(key)
+            owner = done is None
+            if owner:
+                done = self._inflight[key] = threading.Event()
+        if not owner:
+            if not wait:
+                return None
+            done.wait()
+            return self.cache.get(key) or []
         try:
-            data = requests.get(url, params=params, timeout=20).json()
+            data = json_loads(self.http.get(url, params=params, timeout=API_TIMEOUT, stream=False).content)
             self.cache.set(key, data)
         except Exception as e:
             data = []
             print(f"{mode.capitalize()} page error:", e)
-        GLib.idle_add(self.fill_track_list, data, not append, append)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            done.set()
+        return data
+
+    def _fetch_page(self, mode, param, page, type_=None, append=False):
+        req = self._page_request(mode, param, page, type_)
+        if not req:
+            return
+        data = self._load_page(mode, *req)
+        GLib.idle_add(self.fill_track_list, valid_tracks(data), not append, append)
         GLib.idle_add(self.page_label.set_text, f"Page: {page}")
+        self._prefetch_page(mode, param, page + 1, type_, data)
+
+    def _prefetch_page(self, mode, param, page, type_=None, prev_data=None):
+        """Warm the cache with `page` while the user looks at the previous one."""
+        if prev_data is not None and not (isinstance(prev_data, list) and len(prev_data) >= self.tracks_per_page):
+            return  # Short page - nothing after it
+        req = self._page_request(mode, param, page, type_)
+        if req:
+            self._load_page(mode, *req, wait=False)
 
     # ---- Lists / UI ----
+    def _track_factory(self, playlist_name: str):
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._row_setup, playlist_name)
+        factory.connect("bind", self._row_bind)
+        factory.connect("unbind", self._row_unbind)
+        return factory
+
+    def _row_setup(self, factory, list_item, playlist_name):
+        view = TrackView()
+        # Single click plays, as the ListBox rows did; ListView alone only activates on double-click/Enter
+        click = Gtk.GestureClick()
+        click.connect("pressed", self._on_row_pressed)
+        click.connect("released", self._on_row_released, list_item, playlist_name)
+        view.add_controller(click)
+        list_item.set_child(view)
+
+    def _on_row_pressed(self, gesture, n_press, x, y):
+        if n_press > 1:
+            # Swallow the double-click so ListView doesn't activate (restart) the track again
+            gesture.set_state(Gtk.EventSequenceState.CLAIMED)
+
+    def _on_row_released(self, gesture, n_press, x, y, list_item, playlist_name):
+        if n_press == 1:
+            self._play_track_from(playlist_name, list_item.get_position())
+
+    def _row_bind(self, factory, list_item):
+        list_item.get_child().bind(list_item.get_item())
+
+    def _row_unbind(self, factory, list_item):
+        list_item.get_child().unbind()
+
     def _clear_all_tracks(self):
-        self.local_tracks = []
-        self.list_all.remove_all()
+        self.all_store.remove_all()
 
     def fill_track_list(self, tracks, clear_first=False, append=False):
+        # `tracks` comes pre-filtered through valid_tracks(), off the main loop
         if clear_first:
             self._clear_all_tracks()
-        if not isinstance(tracks, list):
-            return
-        for t in tracks:
-            if not isinstance(t, dict):
-                continue
-            self.local_tracks.append(t)
-            self.list_all.append(TrackRow(t))
+        self.all_store.splice(self.all_store.get_n_items(), 0, [TrackItem(t) for t in tracks])
         if not append:
-            self.list_all.select_row(None)
+            self.all_selection.set_selected(Gtk.INVALID_LIST_POSITION)
 
     def update_artist_info(self, info: dict):
+        # Pagination re-posts the same info; only touch widgets on an actual change
         avatar_url = info.get("avatar_url")
+        if not (avatar_url and avatar_url.startswith("http")):
+            avatar_url = None
         desc = info.get("description") or "(No description available)"
-        self.artist_desc.set_text(desc)
-        if avatar_url and avatar_url.startswith("http"):
-            def worker():
-                tex = texture_from_bytes(fetch_image_bytes(avatar_url))
-                if tex:
-                    GLib.idle_add(self.artist_avatar.set_paintable, tex)
-                else:
-                    GLib.idle_add(self.artist_avatar.set_paintable, get_placeholder_texture())
-            threading.Thread(target=worker, daemon=True).start()
+        if desc != self._cur_desc:
+            self._cur_desc = desc
+            self.artist_desc.set_text(desc)
+        if avatar_url == self._cur_avatar_url:
+            return
+        self._cur_avatar_url = avatar_url
+        if avatar_url:
+            AsyncFetcher.instance().submit(
+                avatar_url, lambda tex: self._set_artist_avatar(avatar_url, tex), size=120
+            )
         else:
-            self.artist_avatar.set_paintable(get_placeholder_texture())
+            self.artist_avatar.set_paintable(self._placeholder_tex)
+
+    def _set_artist_avatar(self, avatar_url, tex):
+        if avatar_url == self._cur_avatar_url:  # Artist may have changed meanwhile
+            self.artist_avatar.set_paintable(tex or self._placeholder_tex)
+        return False
 
     # ---- Playback / Auto-play ----
     def _play_track_from(self, playlist_name: str, index: int):
         # Set playlist and index
-        if playlist_name == "selected":
-            if not (0 <= index < len(self.selected_tracks)):
-                return
-            t = self.selected_tracks[index]
-        else:
-            if not (0 <= index < len(self.local_tracks)):
-                return
-            t = self.local_tracks[index]
+        if playlist_name != "selected":
             playlist_name = "all"
+        store = self.selected_store if playlist_name == "selected" else self.all_store
+        if not (0 <= index < store.get_n_items()):
+            return
+        t = store.get_item(index).track
 
         stream = t.get("stream_url")
         if not stream:
             return
 
         self.current_playlist = playlist_name
+        self._active_list = store
         self.current_index = index
+        self._update_next_track()
+        self._about_to_finish_fired = False
 
         # Set source
         self.player.set_uri(stream)
         self.player.play()
         self.playpause_btn.set_icon_name("media-playback-pause-symbolic")
+        self._start_position_updates()
+        self._show_now_playing(t)
 
+    def _show_now_playing(self, t: dict):
+        self._last_cover_hash = None  # New track: its embedded cover must be shown again
         # "Now playing" section
-        title = t.get("title") or "Unknown"
-        user = t.get("user", {}).get("username") or ""
-        genre = t.get("genre") or (t.get("category") or "")
-        self.now_title.set_text(title)
-        meta_line = user if user else (f"genre: {genre}" if genre else "")
-        self.now_meta.set_text(meta_line)
+        self._update_now_playing_labels(t)
 
         # Cover from API (initially), then ID3 if available from TAG
         cover = t.get("artwork_url") or t.get("thumb") or t.get("images", {}).get("thumbnail")
         if cover and cover.startswith("http"):
-            def worker():
-                tex = texture_from_bytes(fetch_image_bytes(cover))
-                if tex:
-                    GLib.idle_add(self.now_cover.set_paintable, tex)
-            threading.Thread(target=worker, daemon=True).start()
+            AsyncFetcher.instance().submit(cover, self._set_now_cover, size=200)
         else:
             self.now_cover.set_paintable(None)
 
-    def on_row_activated(self, listbox, row: TrackRow):
-        if not row or not isinstance(row, TrackRow):
-            return
-        idx = list(self.list_all).index(row)
-        self._play_track_from("all", idx)
+    def _set_now_cover(self, tex):
+        if tex:
+            self.now_cover.set_paintable(tex)
+        return False
 
-    def on_row_activated_selected(self, listbox, row: TrackRow):
-        if not row or not isinstance(row, TrackRow):
-            return
-        idx = list(self.list_selected).index(row)
-        self._play_track_from("selected", idx)
+    def on_row_activated(self, listview, position: int):
+        self._play_track_from("all", position)
+
+    def on_row_activated_selected(self, listview, position: int):
+        self._play_track_from("selected", position)
 
     def on_play_pause(self, *_):
         st = self.player.state()
         if st == Gst.State.PLAYING:
             self.player.pause()
             self.playpause_btn.set_icon_name("media-playback-start-symbolic")
-        else:
+            self._stop_position_updates()
+        elif self.player.has_uri():  # Nothing loaded yet - no point arming the timer
             self.player.play()
             self.playpause_btn.set_icon_name("media-playback-pause-symbolic")
+            self._start_position_updates()
 
     def on_stop(self, *_):
         self.player.stop()
+        self._stop_position_updates()
         self.playpause_btn.set_icon_name("media-playback-start-symbolic")
         self.pos_scale.set_value(0)
         self.time_label.set_text("00:00 / 00:00")
@@ -769,10 +1227,29 @@ class HearThisApp(Gtk.Application):
     def on_seek(self, scale: Gtk.Scale):
         if not self.is_seeking:
             return
-        sec = int(scale.get_value())
-        self.player.seek_seconds(sec)
+        # Debounce drags: only the value settled on for 80 ms is sought to
+        self._pending_seek = int(scale.get_value())
+        if self._seek_src:
+            GLib.source_remove(self._seek_src)
+        self._seek_src = GLib.timeout_add(80, self._commit_seek)
+
+    def _commit_seek(self):
+        self._seek_src = 0
+        self.player.seek_seconds(self._pending_seek)
+        return False
+
+    def _start_position_updates(self):
+        if not self._tick_id:
+            self._tick_id = GLib.timeout_add(250, self.update_position)
+
+    def _stop_position_updates(self):
+        if self._tick_id:
+            GLib.source_remove(self._tick_id)
+            self._tick_id = 0
 
     def update_position(self):
+        if self.player.state() != Gst.State.PLAYING and not self.is_seeking:
+            return True  # Still prerolling/buffering - keep the timer, skip the queries
         try:
             pos, dur = self.player.query_pos_dur()
             if dur <= 0:
@@ -780,8 +1257,10 @@ class HearThisApp(Gtk.Application):
                 self.pos_scale.set_sensitive(False)
             else:
                 self.pos_scale.set_sensitive(True)
-            self.pos_scale.set_range(0, dur)
-            if not self.is_seeking:
+            if dur != self._last_dur:
+                self.pos_scale.set_range(0, dur)
+                self._last_dur = dur
+            if not self.is_seeking and not self._seek_src:
                 self.pos_scale.set_value(pos)
             self.time_label.set_text(f"{pos//60:02}:{pos%60:02} / {dur//60:02}:{dur%60:02}")
         except Exception as e:
@@ -792,10 +1271,7 @@ class HearThisApp(Gtk.Application):
 
     # --- Auto next ---
     def _advance_index(self):
-        if self.current_playlist == "selected":
-            total = len(self.selected_tracks)
-        else:
-            total = len(self.local_tracks)
+        total = self._active_list.get_n_items()
         if total == 0:
             return -1
         nxt = self.current_index + 1
@@ -803,92 +1279,208 @@ class HearThisApp(Gtk.Application):
             return -1  # No next track (could loop -> nxt = 0)
         return nxt
 
-    def _on_about_to_finish(self, player: GstPlayer):
-        # Set next URI immediately (gapless)
+    def _update_next_track(self):
         nxt = self._advance_index()
-        if nxt < 0:
+        self._next_track = (nxt, self._active_list.get_item(nxt).track) if nxt >= 0 else None
+
+    def _on_store_changed(self, store, position, removed, added):
+        if store is self._active_list:
+            self._update_next_track()
+
+    def _on_about_to_finish(self, player: GstPlayer):
+        # Runs in the streaming thread: the next URI must be set right here,
+        # before returning, for playbin to chain it gaplessly.
+        next_track = self._next_track  # One attribute read, no store access off the main loop
+        if next_track is None:
             return
-        if self.current_playlist == "selected":
-            t = self.selected_tracks[nxt]
-        else:
-            t = self.local_tracks[nxt]
+        nxt, t = next_track
         stream = t.get("stream_url")
         if stream:
-            # Set next without starting; playbin will transition
             player.playbin.set_property("uri", stream)
-            # Update index immediately
-            self.current_index = nxt
-            GLib.idle_add(self._update_now_playing_labels, t)
+            self._about_to_finish_fired = True
+            # Index and widgets belong to the main loop
+            GLib.idle_add(self._post_gapless_switch, nxt, t)
+
+    def _post_gapless_switch(self, nxt: int, t: dict):
+        self.current_index = nxt
+        self._update_next_track()
+        self._show_now_playing(t)
+        return False
+
+    def _on_stream_start(self):
+        self._about_to_finish_fired = False
 
     def _on_eos(self):
-        # Fallback if about-to-finish didn't work
+        if self._about_to_finish_fired:
+            # playbin already has the next URI; rebuilding the pipeline here would only race it
+            print("EOS while gapless switch pending - not restarting playback")
+            return
+        self._on_eos_recover()
+
+    def _on_eos_recover(self):
+        # Fallback if about-to-finish didn't queue anything
         nxt = self._advance_index()
         if nxt >= 0:
             self._play_track_from(self.current_playlist, nxt)
+        else:
+            # End of the list: playbin idles in PLAYING, so stop polling it
+            self._stop_position_updates()
+            self.playpause_btn.set_icon_name("media-playback-start-symbolic")
 
     def _update_now_playing_labels(self, t: dict):
         title = t.get("title") or "Unknown"
         user = t.get("user", {}).get("username") or ""
         genre = t.get("genre") or (t.get("category") or "")
-        self.now_title.set_text(title)
-        meta_line = user if user else (f"genre: {genre}" if genre else "")
-        self.now_meta.set_text(meta_line)
+        self._set_now_title(title)
+        self._set_now_meta(self._compose_meta(user, genre))
+
+    @staticmethod
+    def _compose_meta(primary, genre):
+        if primary:
+            return primary
+        if genre:
+            return f"genre: {genre}"
+        return ""
+
+    # Tag bursts repeat the same strings; unchanged text skips Pango re-layout
+    def _set_now_title(self, text: str):
+        if text != self._last_title_text:
+            self._last_title_text = text
+            self.now_title.set_text(text)
+
+    def _set_now_meta(self, text: str):
+        if text != self._last_meta_text:
+            self._last_meta_text = text
+            self.now_meta.set_text(text)
 
     # --- Receive GStreamer tags (ID3 with cover) ---
     def _on_gst_tags(self, taglist: Gst.TagList):
+        # GStreamer walks the list in C; only tags actually present get fetched
+        out = {}
+        taglist.foreach(self._collect_tag, out)
+        if not out:
+            return
+
         # Title / artist / genre
-        title = None
-        artist = None
-        genre = None
-        if taglist.get_string(Gst.TAG_TITLE)[0]:
-            title = taglist.get_string(Gst.TAG_TITLE)[1]
-        if taglist.get_string(Gst.TAG_ARTIST)[0]:
-            artist = taglist.get_string(Gst.TAG_ARTIST)[1]
-        if taglist.get_string(Gst.TAG_GENRE)[0]:
-            genre = taglist.get_string(Gst.TAG_GENRE)[1]
-        if title or artist or genre:
-            GLib.idle_add(self._update_now_playing_from_tags, title, artist, genre)
+        title = out.get("title")
+        artist = out.get("artist")
+        genre = out.get("genre")
 
         # Image: image or preview-image
-        img = None
-        if taglist.get_sample(Gst.TAG_IMAGE)[0]:
-            img = taglist.get_sample(Gst.TAG_IMAGE)[1]
-        elif taglist.get_sample(Gst.TAG_PREVIEW_IMAGE)[0]:
-            img = taglist.get_sample(Gst.TAG_PREVIEW_IMAGE)[1]
-
-        if img:
-            sample = img
-            buf = sample.get_buffer()
-            if not buf:
-                return
-            success, mapinfo = buf.map(Gst.MapFlags.READ)
-            if not success:
-                return
-            try:
-                data = mapinfo.data  # Already bytes
-            finally:
-                buf.unmap(mapinfo)
+        img = out.get("image")
+        if img is None and out.get("preview"):
+            img = taglist.get_sample(self._T_PREVIEW)[1]
+
+        if title or artist or genre:
+            self._queue_now_update(title, artist, genre, None)
+        if not img:
+            return
+        uri = self.player.playbin.get_property("current-uri")
+        with self._tex_cache_lock:
+            cached = self._tex_cache.get(uri)
+            if cached:
+                self._tex_cache.move_to_end(uri)
+        if cached:
+            # Track played before: reuse its decoded cover, skip copy and decode
+            self.last_stream_texture = cached
+            self._queue_now_update(None, None, None, cached)
+            return
+        data = self._cover_bytes_from_sample(img)
+        if data:
+            # Decoding a large embedded cover must not hold up the bus/main loop
+            self._decode_pool.submit(self._decode_and_set_cover, data, uri)
+
+    def _collect_tag(self, taglist, tag, out, _wanted=_WANTED_TAGS):
+        # Called once per tag: globals pre-bound as defaults are plain local loads
+        if tag not in _wanted:
+            return
+        if tag == self._T_TITLE:
+            out["title"] = self._s(taglist, tag)
+        elif tag == self._T_ARTIST:
+            out["artist"] = self._s(taglist, tag)
+        elif tag == self._T_GENRE:
+            out["genre"] = self._s(taglist, tag)
+        elif tag == self._T_IMAGE:
+            out["image"] = taglist.get_sample(tag)[1]
+        else:
+            out["preview"] = True  # Only fetched if there is no full image
+
+    @staticmethod
+    def _s(taglist, tag):
+        # Values as-is, no (ok, value) tuple; multiple ones joined like get_string() does
+        n = taglist.get_tag_size(tag)
+        if n == 1:
+            v = taglist.get_value_index(tag, 0)
+            return v if isinstance(v, str) else None
+        vals = [v for v in (taglist.get_value_index(tag, i) for i in range(n)) if isinstance(v, str)]
+        return ", ".join(vals) or None
+
+    def _cover_bytes_from_sample(self, sample: Gst.Sample):
+        buf = sample.get_buffer()
+        if not buf:
+            return None
+        size = buf.get_size()
+        if size < 8:
+            return None  # Too short to hold a JPEG/PNG header, let alone an image
+        # Peek at the magic first: bogus/corrupt picture tags are dropped before the full copy
+        if not sniff_image_type(buf.extract_dup(0, 8)):
+            return None
+        data = buf.extract_dup(0, size)  # One call, one copy - no map/unmap round-trip
+        # Streams re-send the same embedded cover on every tag update; decode it once
+        h = hash(data)
+        if h == self._last_cover_hash:
+            return None
+        self._last_cover_hash = h
+        return data
 
-            tex = texture_from_bytes(data)
-            if tex:
-                self.last_stream_texture = tex
-                GLib.idle_add(self.now_cover.set_paintable, tex)
+    def _decode_and_set_cover(self, data: bytes, uri: str):
+        tex = decode_cover_bytes(data, 200)
+        if tex:
+            if uri:
+                with self._tex_cache_lock:
+                    self._tex_cache[uri] = tex
+                    while len(self._tex_cache) > TEX_CACHE_SIZE:
+                        self._tex_cache.popitem(last=False)
+            self.last_stream_texture = tex
+            self._queue_now_update(None, None, None, tex)
+
+    def _queue_now_update(self, title, artist, genre, tex, _idle=GLib.idle_add):
+        # Tag bursts during preroll are folded into one pending update and one idle callback
+        with self._now_update_lock:
+            if self._pending_now_update:
+                p_title, p_artist, p_genre, p_tex = self._pending_now_update
+                title, artist = title or p_title, artist or p_artist
+                genre, tex = genre or p_genre, tex or p_tex
+            self._pending_now_update = (title, artist, genre, tex)
+            if self._now_update_scheduled:
+                return
+            self._now_update_scheduled = True
+        _idle(self._flush_now_update)
+
+    def _flush_now_update(self):
+        with self._now_update_lock:
+            title, artist, genre, tex = self._pending_now_update
+            self._pending_now_update = None
+            self._now_update_scheduled = False
+        if title or artist or genre:
+            self._update_now_playing_from_tags(title, artist, genre)
+        if tex:
+            self.now_cover.set_paintable(tex)
+        return False
 
     def _update_now_playing_from_tags(self, title, artist, genre):
         if title:
-            self.now_title.set_text(title)
+            self._set_now_title(title)
         if artist or genre:
-            meta_line = artist if artist else (f"genre: {genre}" if genre else "")
-            self.now_meta.set_text(meta_line)
+            self._set_now_meta(self._compose_meta(artist, genre))
 
     # ---- Selected list management ----
     def on_add_selected(self, *_):
-        row = self.list_all.get_selected_row()
-        if not row or not isinstance(row, TrackRow):
+        item = self.all_selection.get_selected_item()
+        if not item:
             return
-        t = row.track
-        self.selected_tracks.append(t)
-        self.list_selected.append(TrackRow(t))
+        # Same item object: the loaded thumbnail comes along
+        self.selected_store.append(item)
 
 def main(argv):
     app = HearThisApp()